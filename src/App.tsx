@@ -4,17 +4,30 @@ import { Toaster as Sonner } from "@/components/ui/sonner";
 import { TooltipProvider } from "@/components/ui/tooltip";
 import { QueryClient, QueryClientProvider } from "@tanstack/react-query";
 import { BrowserRouter, Routes, Route } from "react-router-dom";
+import { lazy, Suspense } from "react";
 import Index from "./pages/Index";
-import CoursePlanning from "./pages/CoursePlanning";
-import InteractiveLearning from "./pages/InteractiveLearning";
-import Auth from "./pages/Auth";
-import Profile from "./pages/Profile";
-import NotFound from "./pages/NotFound";
+import LoadingPlaceholder from "./components/LoadingPlaceholder";
 import { ChatProvider } from "./contexts/ChatContext";
 import { AuthProvider } from "./contexts/AuthContext";
 
+// Secondary pages pull in dependencies the landing page does not need
+// (react-markdown, KaTeX, resizable panels), so they are split out of the
+// entry bundle and fetched on first visit.
+const CoursePlanning = lazy(() => import("./pages/CoursePlanning"));
+const InteractiveLearning = lazy(() => import("./pages/InteractiveLearning"));
+const Auth = lazy(() => import("./pages/Auth"));
+const Profile = lazy(() => import("./pages/Profile"));
+const NotFound = lazy(() => import("./pages/NotFound"));
+
 const queryClient = new QueryClient();
 
+// Shown while a lazily loaded page chunk is downloading
+const PageFallback = () => (
+  <div className="min-h-screen bg-gray-50 p-4 md:p-8">
+    <LoadingPlaceholder lines={8} className="max-w-3xl mx-auto" />
+  </div>
+);
+
 const App = () => (
   <QueryClientProvider client={queryClient}>
     <TooltipProvider>
@@ -23,14 +36,16 @@ const App = () => (
           <ChatProvider>
             <Toaster />
             <Sonner />
-            <Routes>
-              <Route path="/" element={<Index />} />
-              <Route path="/course-planning" element={<CoursePlanning />} />
-              <Route path="/interactive-learning" element={<InteractiveLearning />} />
-              <Route path="/auth" element={<Auth />} />
-              <Route path="/profile" element={<Profile />} />
-              <Route path="*" element={<NotFound />} />
-            </Routes>
+            <Suspense fallback={<PageFallback />}>
+              <Routes>
+                <Route path="/" element={<Index />} />
+                <Route path="/course-planning" element={<CoursePlanning />} />
+                <Route path="/interactive-learning" element={<InteractiveLearning />} />
+                <Route path="/auth" element={<Auth />} />
+                <Route path="/profile" element={<Profile />} />
+                <Route path="*" element={<NotFound />} />
+              </Routes>
+            </Suspense>
           </ChatProvider>
         </AuthProvider>
       </BrowserRouter>
@@ -1,81 +1,113 @@
 
-import React, { useEffect, useState } from 'react';
-import ReactMarkdown from 'react-markdown';
+import React, { useEffect, useRef, useState } from 'react';
+import ReactMarkdown, { Components } from 'react-markdown';
 import remarkGfm from 'remark-gfm';
 import remarkMath from 'remark-math';
 import rehypeKatex from 'rehype-katex';
 import rehypeRaw from 'rehype-raw';
-import mermaid from 'mermaid';
 import 'katex/dist/katex.min.css';
 
 interface MarkdownRendererProps {
   content: string;
 }
 
-const MarkdownRenderer: React.FC<MarkdownRendererProps> = ({ content }) => {
-  const [key, setKey] = useState(0);
+// Static renderer configuration, shared by every instance instead of being
+// rebuilt on each render
+const remarkPlugins = [remarkGfm, remarkMath];
+const rehypePlugins = [rehypeKatex, rehypeRaw];
 
-  useEffect(() => {
-    mermaid.initialize({
-      startOnLoad: true,
-      theme: 'default',
-      securityLevel: 'loose',
+const LANGUAGE_CLASS_RE = /language-(\w+)/;
+const TRAILING_NEWLINE_RE = /\n$/;
+
+const markdownComponents: Components = {
+  pre({ node, className, children, ...props }) {
+    return (
+      <pre className={className} {...props}>
+        {children}
+      </pre>
+    );
+  },
+  code({ className, children, ...props }) {
+    const match = LANGUAGE_CLASS_RE.exec(className || '');
+
+    // Handle Mermaid diagrams
+    if (match && match[1] === 'mermaid') {
+      return (
+        <div className="mermaid">{String(children).replace(TRAILING_NEWLINE_RE, '')}</div>
+      );
+    }
+
+    // Check if it's an inline code block based on className
+    const isInline = !className || !className.includes('language-');
+
+    return isInline ? (
+      <code className="inline-code" {...props}>
+        {children}
+      </code>
+    ) : (
+      <code className={className} {...props}>
+        {children}
+      </code>
+    );
+  },
+};
+
+type Mermaid = typeof import('mermaid').default;
+
+// Mermaid is large, so it is only fetched the first time a diagram is rendered
+let mermaidPromise: Promise<Mermaid> | null = null;
+
+const loadMermaid = (): Promise<Mermaid> => {
+  if (!mermaidPromise) {
+    mermaidPromise = import('mermaid').then(({ default: mermaid }) => {
+      mermaid.initialize({
+        startOnLoad: true,
+        theme: 'default',
+        securityLevel: 'loose',
+      });
+      return mermaid;
     });
-  }, []);
+  }
+  return mermaidPromise;
+};
+
+const MarkdownRenderer: React.FC<MarkdownRendererProps> = ({ content }) => {
+  const [key, setKey] = useState(0);
+  const containerRef = useRef<HTMLDivElement>(null);
 
   // Process the content to handle mermaid diagrams
   useEffect(() => {
-    const processMermaid = () => {
-      const elements = document.querySelectorAll('.mermaid');
+    // Only load mermaid if the renderer actually produced a diagram node
+    if (!containerRef.current?.querySelector('.mermaid')) return;
+
+    let cancelled = false;
+
+    const processMermaid = async () => {
+      const mermaid = await loadMermaid();
+      if (cancelled || !containerRef.current) return;
+
+      const elements = containerRef.current.querySelectorAll<HTMLElement>('.mermaid');
       
       if (elements.length > 0) {
-        // Type assertion to address TypeScript error
-        mermaid.init(undefined, elements as NodeListOf<HTMLElement>);
+        mermaid.init(undefined, elements);
         // Force a re-render to ensure mermaid diagrams are properly displayed
         setKey(prev => prev + 1);
       }
     };
 
     processMermaid();
+
+    return () => {
+      cancelled = true;
+    };
   }, [content]);
 
   return (
-    <div className="markdown-content" key={key}>
+    <div className="markdown-content" key={key} ref={containerRef}>
       <ReactMarkdown
-        remarkPlugins={[remarkGfm, remarkMath]}
-        rehypePlugins={[rehypeKatex, rehypeRaw]}
-        components={{
-          pre({ node, className, children, ...props }) {
-            return (
-              <pre className={className} {...props}>
-                {children}
-              </pre>
-            );
-          },
-          code({ className, children, ...props }) {
-            const match = /language-(\w+)/.exec(className || '');
-            
-            // Handle Mermaid diagrams
-            if (match && match[1] === 'mermaid') {
-              return (
-                <div className="mermaid">{String(children).replace(/\n$/, '')}</div>
-              );
-            }
-            
-            // Check if it's an inline code block based on className
-            const isInline = !className || !className.includes('language-');
-            
-            return isInline ? (
-              <code className="inline-code" {...props}>
-                {children}
-              </code>
-            ) : (
-              <code className={className} {...props}>
-                {children}
-              </code>
-            );
-          },
-        }}
+        remarkPlugins={remarkPlugins}
+        rehypePlugins={rehypePlugins}
+        components={markdownComponents}
       >
         {content}
       </ReactMarkdown>
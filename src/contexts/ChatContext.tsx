@@ -40,11 +40,12 @@ export const ChatProvider = ({ children }: { children: ReactNode }) => {
 
   // Add a new message to the chat
   const addMessage = (content: string, sender: 'user' | 'agent') => {
+    const timestamp = new Date();
     const newMessage: MessageType = {
-      id: Date.now().toString(),
+      id: timestamp.getTime().toString(),
       content,
       sender,
-      timestamp: new Date(),
+      timestamp,
     };
     setMessages((prevMessages) => [...prevMessages, newMessage]);
   };
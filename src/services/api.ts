@@ -12,8 +12,37 @@ export const sendQueryToAgent = async (query: string): Promise<string> => {
   return `这是对"${query}"的模拟回复。在实际应用中，这将由后端Agent服务提供。`;
 };
 
+// In-flight or completed outline requests by topic, evicted least recently used first
+const COURSE_OUTLINE_CACHE_SIZE = 256;
+const courseOutlineCache = new Map<string, Promise<any>>();
+
+// Function to get a course outline, reusing a previous result for the same topic
+export const getCourseOutline = (topic: string): Promise<any> => {
+  const key = topic.trim();
+  const cached = courseOutlineCache.get(key);
+  if (cached) {
+    courseOutlineCache.delete(key);
+    courseOutlineCache.set(key, cached);
+    return cached;
+  }
+
+  const request = fetchCourseOutline(key).catch((error) => {
+    // Do not cache failures so the next attempt can retry
+    if (courseOutlineCache.get(key) === request) {
+      courseOutlineCache.delete(key);
+    }
+    throw error;
+  });
+  courseOutlineCache.set(key, request);
+  if (courseOutlineCache.size > COURSE_OUTLINE_CACHE_SIZE) {
+    const oldest = courseOutlineCache.keys().next().value;
+    if (oldest !== undefined) courseOutlineCache.delete(oldest);
+  }
+  return request;
+};
+
 // Function to simulate getting course outline
-export const getCourseOutline = async (topic: string): Promise<any> => {
+const fetchCourseOutline = async (topic: string): Promise<any> => {
   console.log('Getting course outline for:', topic);
   
   // Simulate API call delay